@@ -1,4 +1,4 @@
-from typing import Any, Union, cast
+from typing import Any, Callable, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -6,61 +6,61 @@ import pandas as pd
 import pyproj
 
 
-def _douglas_peucker_rec(
-    x: npt.NDArray[Any],
-    y: npt.NDArray[Any],
-    mask: npt.NDArray[Any],
-    tolerance: float,
-) -> None:
-    len_x = len(x)
-    if len_x < 3:
-        return
-
-    v = np.array([[y[len_x - 1] - y[0]], [x[0] - x[len_x - 1]]])
-    d = np.abs(
-        np.dot(
-            np.dstack([x[1:-1] - x[0], y[1:-1] - y[0]])[0],
-            v / np.sqrt(np.sum(v * v)),
-        )
-    )
+def _distance_2d(
+    x: npt.NDArray[Any], y: npt.NDArray[Any]
+) -> Tuple[npt.NDArray[Any], float]:
+    """Squared distance of inner points to the line between both ends.
+
+    The distances are returned up to the squared length of the segment, which
+    is returned as a second element, so that no division or square root is
+    needed to compare them to the tolerance.
+    """
+    dx, dy = x[-1] - x[0], y[-1] - y[0]
+    cross = (x[1:-1] - x[0]) * dy - (y[1:-1] - y[0]) * dx
+    return cross * cross, dx * dx + dy * dy
+
 
-    if np.max(d) < tolerance:
-        mask[np.s_[1 : len_x - 1]] = 0
-        return
+def _distance_3d(
+    x: npt.NDArray[Any], y: npt.NDArray[Any], z: npt.NDArray[Any]
+) -> Tuple[npt.NDArray[Any], float]:
+    """Squared distance of inner points to the line between both ends.
 
-    arg = cast(int, np.argmax(d))
-    _douglas_peucker_rec(x[: arg + 2], y[: arg + 2], mask[: arg + 2], tolerance)
-    _douglas_peucker_rec(x[arg + 1 :], y[arg + 1 :], mask[arg + 1 :], tolerance)
+    See :func:`_distance_2d` for the scaling of the returned values.
+    """
+    dx, dy, dz = x[-1] - x[0], y[-1] - y[0], z[-1] - z[0]
+    px, py, pz = x[1:-1] - x[0], y[1:-1] - y[0], z[1:-1] - z[0]
+    cx = py * dz - pz * dy
+    cy = pz * dx - px * dz
+    cz = px * dy - py * dx
+    return cx * cx + cy * cy + cz * cz, dx * dx + dy * dy + dz * dz
 
 
-def _douglas_peucker_rec_3d(
-    x: npt.NDArray[Any],
-    y: npt.NDArray[Any],
-    z: npt.NDArray[Any],
-    mask: npt.NDArray[Any],
+def _douglas_peucker(
+    distance: Callable[..., Tuple[npt.NDArray[Any], float]],
+    coords: Tuple[npt.NDArray[Any], ...],
     tolerance: float,
-) -> None:
-    len_x = len(x)
-    if len_x < 3:
-        return
-
-    start = np.array([x[0], y[0], z[0]])
-    end = np.array([x[-1], y[-1], z[-1]])
-    point = np.dstack([x[1:], y[1:], z[1:]])[0] - start
-    d = np.cross(point, (start - end) / np.linalg.norm(start - end))
-    d = np.sqrt(np.sum(d * d, axis=1))
-
-    if np.max(d) < tolerance:
-        mask[np.s_[1 : len_x - 1]] = 0
-        return
-
-    arg = cast(int, np.argmax(d))
-    _douglas_peucker_rec_3d(
-        x[: arg + 2], y[: arg + 2], z[: arg + 2], mask[: arg + 2], tolerance
-    )
-    _douglas_peucker_rec_3d(
-        x[arg + 1 :], y[arg + 1 :], z[arg + 1 :], mask[arg + 1 :], tolerance
-    )
+) -> npt.NDArray[np.bool_]:
+    # Iterate over an explicit stack of (first, last) index pairs rather than
+    # recursing: long trajectories would exceed the interpreter recursion limit
+    mask = np.ones(len(coords[0]), dtype=bool)
+    stack = [(0, len(mask) - 1)]
+    squared_tolerance = tolerance * tolerance
+
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        d2, norm2 = distance(*(c[first : last + 1] for c in coords))
+        if np.max(d2) < squared_tolerance * norm2:
+            mask[first + 1 : last] = False
+            continue
+
+        split = first + 1 + int(np.argmax(d2))
+        stack.append((split, last))
+        stack.append((first, split))
+
+    return mask
 
 
 def douglas_peucker(
@@ -138,10 +138,6 @@ def douglas_peucker(
             z = df[z].values
         z = z_factor * np.array(z)
 
-    mask: npt.NDArray[Any] = np.ones(len(x), dtype=bool)
     if z is None:
-        _douglas_peucker_rec(x, y, mask, tolerance)
-    else:
-        _douglas_peucker_rec_3d(x, y, z, mask, tolerance)
-
-    return mask
+        return _douglas_peucker(_distance_2d, (x, y), tolerance)
+    return _douglas_peucker(_distance_3d, (x, y, z), tolerance)
@@ -61,17 +61,14 @@ class RunwayAlignment:
             raise RuntimeError("Airport or runway information missing")
 
     def apply(self, flight: Flight) -> Iterator[Flight]:
+        linestring = LineString(flight._xy_time)
         if isinstance(self.airport.runways.shape, LineString):
             candidate_shapes = [
-                LineString(list(flight.xy_time)).intersection(
-                    self.airport.runways.shape.buffer(5e-4)
-                )
+                linestring.intersection(self.airport.runways.shape.buffer(5e-4))
             ]
         else:
             candidate_shapes = [
-                LineString(list(flight.xy_time)).intersection(
-                    on_runway.buffer(5e-4)
-                )
+                linestring.intersection(on_runway.buffer(5e-4))
                 for on_runway in self.airport.runways.shape.geoms
             ]
 
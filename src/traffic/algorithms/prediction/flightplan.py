@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from datetime import timedelta
 from typing import Dict, List, Sequence, Union, cast
 
 from pitot.geodesy import distance
 
+import numpy as np
 import pandas as pd
 
 from ...core import types as tt
@@ -122,36 +122,36 @@ class FlightPlanPredict:
         start_index = navaids.index(start_nav)  # type: ignore
         rest_navaids = navaids[start_index:]
 
-        point_depart: PointLike = Point(
-            latitude=start_pos.latitude,
-            longitude=start_pos.longitude,
-            name=start_nav_name,
+        # all legs at once: from the current position to the first navaid,
+        # then from one navaid to the next
+        latitudes = np.array(
+            [start_pos.latitude, *(n.latitude for n in rest_navaids)]
+        )
+        longitudes = np.array(
+            [start_pos.longitude, *(n.longitude for n in rest_navaids)]
+        )
+        legs = distance(
+            latitudes[:-1], longitudes[:-1], latitudes[1:], longitudes[1:]
+        )
+        start = pd.Timestamp(self.start)
+        timestamps = start + pd.to_timedelta(
+            np.cumsum((legs / gs).astype(np.int64)), unit="s"
         )
-        new_timestamp = pd.Timestamp(self.start)
-
-        for navaid in rest_navaids:
-            dmin = distance(
-                point_depart.latitude,
-                point_depart.longitude,
-                navaid.latitude,
-                navaid.longitude,
-            )
-            t = int(dmin / gs)
-            new_timestamp = new_timestamp + timedelta(seconds=t)
-            point_depart = navaid
 
+        # stop at the first navaid reached after the horizon
+        after_horizon = np.flatnonzero(
+            (timestamps - start).total_seconds() / 60 > self.horizon_minutes
+        )
+        if after_horizon.shape[0] > 0:
+            rest_navaids = rest_navaids[: after_horizon[0] + 1]
+            timestamps = timestamps[: after_horizon[0] + 1]
+
+        for navaid, new_timestamp in zip(rest_navaids, timestamps):
             data_points["latitude"].append(navaid.latitude)
             data_points["longitude"].append(navaid.longitude)
             data_points["timestamp"].append(new_timestamp)
             data_points["groundspeed"].append(gs / 0.514444)
 
-            tdiff_minutes = (new_timestamp - self.start).total_seconds() / 60
-            if (
-                tdiff_minutes > self.horizon_minutes
-                and len(data_points["timestamp"]) > 1
-            ):
-                break
-
         new_columns = {
             **data_points,
             "icao24": flight.icao24,
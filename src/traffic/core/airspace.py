@@ -23,6 +23,7 @@ import rich.repr
 
 import numpy as np
 import pyproj
+import shapely
 from shapely.geometry import Polygon, base, mapping, polygon, shape
 from shapely.ops import orient, transform, unary_union
 
@@ -163,9 +164,12 @@ class Airspace(ShapelyMixin):
         """Returns the 2D footprint of the airspace."""
         return orient(unary_union([p.polygon for p in self]), -1)
 
-    @property
+    @cached_property
     def shape(self) -> "BaseGeometry":
-        return self.flatten()
+        # prepared once, then reused by every intersects/clip predicate
+        footprint = self.flatten()
+        shapely.prepare(footprint)
+        return footprint
 
     def leaflet(self, **kwargs: Any) -> LeafletPolygon:
         """Returns a Leaflet layer to be directly added to a Map.
@@ -492,10 +496,13 @@ def _flight_intersects(
     if flight is None or (linestring := flight.linestring) is None:
         return False
     if isinstance(shape, base.BaseGeometry):
-        return not linestring.intersection(shape).is_empty
+        return bool(shapely.intersects(shape, linestring))
     if not isinstance(shape, Airspace):  # i.e. ShapelyMixin
-        return not linestring.intersection(shape.shape).is_empty
+        return bool(shapely.intersects(shape.shape, linestring))
     for layer in shape:
+        # cheap rejection before the intersection
+        if not shapely.intersects(layer.polygon, linestring):
+            continue
         ix = linestring.intersection(layer.polygon)
         if not ix.is_empty:
             assert layer.lower is not None
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import ast
+import json
 import logging
 import re
 import warnings
 from datetime import datetime, timedelta, timezone
-from functools import lru_cache, reduce
-from itertools import combinations
+from functools import cached_property, lru_cache, wraps
+from itertools import pairwise
 from operator import attrgetter
 from pathlib import Path
 from typing import (
@@ -28,18 +29,21 @@ from typing import (
     overload,
 )
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import rich.repr
 import rs1090
 from impunity import impunity
 from pitot import geodesy as geo
 from rich.console import Console, ConsoleOptions, RenderResult
-from typing_extensions import Self
+from typing_extensions import Annotated, Self
 
 import numpy as np
 import pandas as pd
 import pyproj
+import shapely
 from pandas.core.internals.blocks import DatetimeTZBlock
-from shapely.geometry import LineString, MultiPoint, Point, Polygon, base
+from shapely.geometry import LineString, Point, Polygon, base
 from shapely.ops import transform
 
 from ..algorithms import filters
@@ -112,21 +116,163 @@ def _split(
     # This method helps splitting a flight into several.
     if data.shape[0] < 2:
         return
-    diff = data.timestamp.diff()
     if unit is None:
         delta = pd.Timedelta(value)
     else:
         delta = pd.Timedelta(np.timedelta64(value, unit))  # type: ignore
-    # There seems to be a change with numpy >= 1.18
-    # max() now may return NaN, therefore the following fix
-    max_ = diff.max()
-    if max_ > delta:
-        # np.nanargmax seems bugged with timestamps
-        argmax = diff.argmax()
-        yield from _split(data.iloc[:argmax], value, unit)
-        yield from _split(data.iloc[argmax:], value, unit)
-    else:
-        yield data
+    # all gaps at once rather than recursing on the largest one; NaT
+    # differences never compare greater than delta
+    diff = data.timestamp.diff().to_numpy()
+    breaks = np.flatnonzero(diff > delta.to_timedelta64())
+    for start, stop in pairwise([0, *breaks, data.shape[0]]):
+        # segments of less than two points have always been discarded
+        if stop - start >= 2:
+            yield data.iloc[start:stop]
+
+
+def _resample_first(data: pd.DataFrame, rule: str) -> pd.DataFrame:
+    # Equivalent to data.set_index("timestamp").resample(rule).first(), but
+    # the first valid row of each bin is looked up on integer positions:
+    # aggregating Arrow-backed string columns falls back to pure Python.
+    columns = data.columns.drop("timestamp")
+    positions = np.arange(data.shape[0], dtype=np.float64)
+    first = (
+        pd.DataFrame(
+            {
+                col: np.where(data[col].notna().to_numpy(), positions, np.nan)
+                for col in columns
+            },
+            index=pd.DatetimeIndex(data.timestamp),
+        )
+        .resample(rule)
+        .first()
+    )
+
+    result = {}
+    for col in columns:
+        values = data[col].array
+        if isinstance(values, pd.arrays.NumpyExtensionArray):
+            values = values.to_numpy()
+        indices = first[col].fillna(-1).to_numpy(dtype=np.int64)
+        if values.dtype == np.bool_ and (indices < 0).any():
+            # as with .first(), empty bins turn NumPy booleans into floats
+            values = values.astype(np.float64)
+        result[col] = pd.api.extensions.take(values, indices, allow_fill=True)
+
+    return (
+        pd.DataFrame(result, index=first.index)
+        .reset_index(names="timestamp")
+        .astype({"timestamp": data.timestamp.dtype})
+    )
+
+
+@lru_cache()
+def _platecarree() -> "crs.PlateCarree":
+    # Building a CRS is not free: share one instance across plot calls.
+    from cartopy.crs import PlateCarree
+
+    return PlateCarree()
+
+
+@lru_cache()
+def _fuelflow_methods() -> Dict[str, Callable[..., "EstimatorBase"]]:
+    # Performance models import the core module: resolve them lazily, once.
+    from ..algorithms.performance import openap
+
+    return dict(
+        default=openap.FuelflowEstimation,
+        openap=openap.FuelflowEstimation,
+    )
+
+
+@lru_cache()
+def _emission_methods() -> Dict[str, Callable[..., "EstimatorBase"]]:
+    from ..algorithms.performance import openap
+
+    return dict(
+        default=openap.PollutantEstimation,
+        openap=openap.PollutantEstimation,
+    )
+
+
+def _deprecated_iterator(
+    replacement: str,
+) -> Callable[
+    [Callable[..., Iterator["Flight"]]], Callable[..., FlightIterator]
+]:
+    """Marks a generator method as a deprecated alias of ``replacement``.
+
+    As with any generator, the DeprecationWarning is only emitted when the
+    resulting iterator is consumed.
+    """
+
+    def decorator(
+        fun: Callable[..., Iterator["Flight"]],
+    ) -> Callable[..., FlightIterator]:
+        @wraps(fun)
+        def method(*args: Any, **kwargs: Any) -> Iterator["Flight"]:
+            warnings.warn(
+                f"Deprecated {fun.__name__} method, "
+                f"use .{replacement}() instead",
+                DeprecationWarning,
+            )
+            yield from fun(*args, **kwargs)
+
+        return flight_iterator(method)
+
+    return decorator
+
+
+def _dme_nse(
+    d1: np.ndarray, b1: np.ndarray, d2: np.ndarray, b2: np.ndarray
+) -> np.ndarray:
+    # DME/DME Navigation System Error (2 sigma, in nm) from the ranges (in nm)
+    # and bearings (in degrees) to both DME
+    sigma_dme_sis = 0.05
+
+    # angle subtended by the two DME, only valid between 30 and 150 degrees
+    angle = np.abs(b1 - b2)
+    angle = np.where(angle > 180, 360 - angle, angle)
+    angle = np.where((angle >= 30) & (angle <= 150), angle, np.nan)
+
+    rad = np.deg2rad(angle)
+    valid = ~np.isnan(rad)
+    sin_angle = np.sin(rad, where=valid, out=np.full_like(rad, np.nan))
+
+    sigma_dme_1_air = np.maximum(d1 * 0.125 / 100, 0.085)
+    sigma_dme_2_air = np.maximum(d2 * 0.125 / 100, 0.085)
+    numerator = 2 * np.sqrt(
+        sigma_dme_1_air**2 + sigma_dme_2_air**2 + 2 * sigma_dme_sis**2
+    )
+
+    return np.divide(  # type: ignore
+        numerator,
+        sin_angle,
+        out=np.full_like(numerator, np.nan),
+        where=valid & (sin_angle != 0),
+    )
+
+
+_geod = pyproj.Geod(ellps="WGS84")
+
+# number of NSE values (pairs of DME x points) computed at once
+_DME_NSE_CHUNK = 1 << 20
+_NAT = np.iinfo(np.int64).min  # NaT as int64 nanoseconds
+
+
+def _geodesic_inv(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Track (in degrees) and distance (in m) from points 1 to points 2."""
+    track, _, distance = _geod.inv(lon1, lat1, lon2, lat2)
+    return track, distance
+
+
+def _geodesic_steps(
+    lat: np.ndarray, lon: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Track (in degrees) and distance (in m) between consecutive points."""
+    return _geodesic_inv(lat[:-1], lon[:-1], lat[1:], lon[1:])
 
 
 default_angle_features = ["track", "heading"]
@@ -811,28 +957,68 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
     def timestamp(self) -> Iterator[pd.Timestamp]:
         yield from self.data.timestamp
 
+    @cached_property
+    def _xyz(self) -> np.ndarray:
+        """Longitude, latitude and altitude of all points with a position.
+
+        The result is a contiguous (n, 3) float64 array, shared by all the
+        methods iterating on coordinates. Altitude is 0 if not available.
+        """
+        data = self.data.loc[self.data.longitude.notnull()]
+        altitude = (
+            data.altitude.to_numpy(dtype=np.float64, na_value=np.nan)
+            if "altitude" in data.columns
+            else np.zeros(len(data))
+        )
+        return np.column_stack(
+            [
+                data.longitude.to_numpy(dtype=np.float64),
+                data.latitude.to_numpy(dtype=np.float64),
+                altitude,
+            ]
+        )
+
+    @cached_property
+    def _timestamp_ns(self) -> np.ndarray:
+        """Timestamps (int64 nanoseconds) of all rows, NaT included."""
+        timestamp = self.data.timestamp
+        values: np.ndarray = timestamp.to_numpy(dtype="datetime64[ns]")
+        return values.astype(np.int64)
+
+    @cached_property
+    def _timestamp_sorted(self) -> bool:
+        """True if :attr:`_timestamp_ns` is non-empty, sorted and NaT-free."""
+        t = self._timestamp_ns
+        return t.shape[0] > 0 and t[0] != _NAT and bool(np.all(t[1:] >= t[:-1]))
+
+    @cached_property
+    def _t_epoch(self) -> np.ndarray:
+        """Timestamps (int64 nanoseconds) aligned with :attr:`_xyz`."""
+        timestamp = self.data.timestamp.loc[self.data.longitude.notnull()]
+        values: np.ndarray = timestamp.to_numpy(dtype="datetime64[ns]")
+        return values.astype(np.int64)
+
+    @cached_property
+    def _xy_time(self) -> np.ndarray:
+        """Longitude, latitude and timestamp (in seconds since epoch) of all
+        points with a position, as a (n, 3) float64 array."""
+        xyz = self._xyz
+        return np.column_stack([xyz[:, 0], xyz[:, 1], self._t_epoch / 1e9])
+
     @property
     def coords(self) -> Iterator[Tuple[float, float, float]]:
-        data = self.data.query("longitude.notnull()")
-        if "altitude" not in data.columns:
-            data = data.assign(altitude=0)
-        yield from zip(
-            data["longitude"].to_numpy(),
-            data["latitude"].to_numpy(),
-            # This is a bit more robust to the new dtypes with pd.NA
-            data["altitude"].astype(float).to_numpy(),
-        )
+        yield from zip(*self._xyz.T)
 
     def coords4d(self, delta_t: bool = False) -> Iterator[Entry]:
-        data = self.data.query("longitude.notnull()")
+        xyz = self._xyz
         if delta_t:
-            time = (data.timestamp - data.timestamp.min()).dt.total_seconds()
+            t_epoch = self._t_epoch
+            time = (t_epoch - t_epoch.min()) / 1e9
         else:
+            data = self.data.loc[self.data.longitude.notnull()]
             time = data["timestamp"]
 
-        for t, longitude, latitude, altitude in zip(
-            time, data["longitude"], data["latitude"], data["altitude"]
-        ):
+        for t, (longitude, latitude, altitude) in zip(time, xyz):
             if delta_t:
                 yield {
                     "timedelta": t,
@@ -850,16 +1036,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
     @property
     def xy_time(self) -> Iterator[Tuple[float, float, float]]:
-        self_filtered = self.query("longitude.notnull()")
-        if self_filtered is None:
-            return None
-        iterator = iter(zip(self_filtered.coords, self_filtered.timestamp))
-        while True:
-            next_ = next(iterator, None)
-            if next_ is None:
-                return
-            coords, time = next_
-            yield (coords[0], coords[1], time.to_pydatetime().timestamp())
+        yield from zip(*self._xy_time.T)
 
     # --- Properties (and alike) ---
 
@@ -1254,6 +1431,39 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
     # -- Time handling, splitting, interpolation and resampling --
 
+    def _time_window(
+        self,
+        lower: None | pd.Timestamp = None,
+        upper: None | pd.Timestamp = None,
+        inclusive: Literal["both", "neither", "left", "right"] = "both",
+    ) -> pd.DataFrame:
+        # Rows with a timestamp between lower and upper (None means unbounded)
+        # Sorted timestamps (the usual case) only need two binary searches;
+        # other flights fall back to a boolean mask.
+        left = inclusive in ("both", "left")
+        right = inclusive in ("both", "right")
+        t = self._timestamp_ns
+        if self._timestamp_sorted:
+            start, stop = 0, t.shape[0]
+            if lower is not None:
+                side: Literal["left", "right"] = "left" if left else "right"
+                start = int(np.searchsorted(t, pd.Timestamp(lower).value, side))
+            if upper is not None:
+                side = "right" if right else "left"
+                stop = int(np.searchsorted(t, pd.Timestamp(upper).value, side))
+            return self.data.iloc[start:stop]
+        timestamp = self.data.timestamp
+        mask = np.ones(timestamp.shape[0], dtype=bool)
+        if lower is not None:
+            mask &= (
+                timestamp >= lower if left else timestamp > lower
+            ).to_numpy(dtype=bool, na_value=False)
+        if upper is not None:
+            mask &= (
+                timestamp <= upper if right else timestamp < upper
+            ).to_numpy(dtype=bool, na_value=False)
+        return self.data.loc[mask]
+
     def skip(
         self, value: None | deltalike = None, **kwargs: Any
     ) -> Optional[Flight]:
@@ -1269,9 +1479,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         >>> flight.skip(10)  # seconds by default
         """
         delta = to_timedelta(value, **kwargs)
-        bound = self.start + delta  # noqa: F841 => used in the query
-        # full call is necessary to keep @bound as a local variable
-        df = self.data.query("timestamp >= @bound")
+        df = self._time_window(lower=self.start + delta)
         if df.shape[0] == 0:
             return None
         return self.__class__(df)
@@ -1289,9 +1497,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         >>> flight.first(10)  # seconds by default
         """
         delta = to_timedelta(value, **kwargs)
-        bound = self.start + delta  # noqa: F841 => used in the query
-        # full call is necessary to keep @bound as a local variable
-        df = self.data.query("timestamp < @bound")
+        df = self._time_window(upper=self.start + delta, inclusive="left")
         if df.shape[0] == 0:
             # this shouldn't happen
             return None  # type: ignore
@@ -1312,9 +1518,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         >>> flight.shorten(10)  # seconds by default
         """
         delta = to_timedelta(value, **kwargs)
-        bound = self.stop - delta  # noqa: F841 => used in the query
-        # full call is necessary to keep @bound as a local variable
-        df = self.data.query("timestamp <= @bound")
+        df = self._time_window(upper=self.stop - delta)
         if df.shape[0] == 0:
             return None
         return self.__class__(df)
@@ -1332,9 +1536,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         >>> flight.last(10)  # seconds by default
         """
         delta = to_timedelta(value, **kwargs)
-        bound = self.stop - delta  # noqa: F841 => used in the query
-        # full call is necessary to keep @bound as a local variable
-        df = self.data.query("timestamp > @bound")
+        df = self._time_window(lower=self.stop - delta, inclusive="right")
         if df.shape[0] == 0:
             # this shouldn't happen
             return None  # type: ignore
@@ -1380,12 +1582,9 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         else:
             stop = to_datetime(stop)
 
-        # full call is necessary to keep @start and @stop as local variables
-        # return self.query('@start < timestamp < @stop')  => not valid
-        if strict:
-            df = self.data.query("@start < timestamp < @stop")
-        else:
-            df = self.data.query("@start <= timestamp <= @stop")
+        df = self._time_window(
+            start, stop, inclusive="neither" if strict else "both"
+        )
 
         if df.shape[0] == 0:
             return None
@@ -1408,12 +1607,23 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             return Position(self.data.ffill().iloc[-1])
 
         index = to_datetime(time)
-        df = self.data.set_index("timestamp")
-        if index not in df.index:
+        # look the timestamp up without re-indexing the whole DataFrame
+        t, value = self._timestamp_ns, index.value
+        if self._timestamp_sorted:
+            first = np.searchsorted(t, value, side="left")
+            last = np.searchsorted(t, value, side="right")
+            matches = np.arange(first, last)
+        else:
+            matches = np.flatnonzero(t == value)
+
+        if matches.shape[0] == 0:
             id_ = getattr(self, "flight_id", self.callsign)
             _log.warning(f"No index {index} for flight {id_}")
             return None
-        return Position(df.loc[index])
+        if matches.shape[0] == 1:
+            row = self.data.iloc[matches[0]]
+            return Position(row.drop("timestamp").rename(row["timestamp"]))
+        return Position(self.data.set_index("timestamp").loc[index])
 
     def at_ratio(self, ratio: float = 0.5) -> Optional[Position]:
         """Returns a position on the trajectory.
@@ -1428,12 +1638,8 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         if ratio < 0 or ratio > 1:
             raise RuntimeError("ratio must be comprised between 0 and 1")
 
-        subset = self.between(
-            self.start, self.start + ratio * self.duration, strict=False
-        )
-
-        assert subset is not None
-        return subset.at()
+        subset = self._time_window(upper=self.start + ratio * self.duration)
+        return Position(subset.ffill().iloc[-1])
 
     @flight_iterator
     def sliding_windows(
@@ -1569,6 +1775,34 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
     ) -> Optional[Flight]:
         return getattr(self, name)(*args, **kwargs)(fun)  # type: ignore
 
+    def _rounded_timestamp(self, freq: str) -> pd.api.extensions.ExtensionArray:
+        # agg_time and apply_time are often called several times with the
+        # same frequency on a given flight
+        rounded = self._rounded_cache.get(freq)
+        if rounded is None:
+            rounded = self.data.timestamp.dt.round(freq).array
+            self._rounded_cache[freq] = rounded
+        return rounded
+
+    @cached_property
+    def _rounded_cache(self) -> Dict[str, pd.api.extensions.ExtensionArray]:
+        # rounded timestamps, indexed by frequency
+        return {}
+
+    def _merge_rounded(self, agg_data: pd.DataFrame) -> Flight:
+        # Equivalent to an inner merge of agg_data (indexed by rounded
+        # timestamps) on the rounded column, without the hash join.
+        if not set(agg_data.columns).isdisjoint(self.data.columns):
+            # let pandas handle the suffixes of conflicting columns
+            return self.merge(agg_data, left_on="rounded", right_index=True)
+        positions = agg_data.index.get_indexer(self.data.rounded)
+        data = self.data
+        if (positions < 0).any():  # NaT timestamps are in no group
+            data = data.loc[positions >= 0]
+            positions = positions[positions >= 0]
+        matched = agg_data.iloc[positions].set_axis(data.index)
+        return self.__class__(pd.concat([data, matched], axis=1))
+
     def apply_time(
         self,
         freq: str = "1 min",
@@ -1594,9 +1828,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         if len(kwargs) == 0:
             raise RuntimeError("No feature provided for aggregation.")
-        temp_flight = self.assign(
-            rounded=lambda df: df.timestamp.dt.round(freq)
-        )
+        temp_flight = self.assign(rounded=self._rounded_timestamp(freq))
 
         agg_data = None
 
@@ -1619,7 +1851,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         if not merge:  # mostly for debugging purposes
             return agg_data  # type: ignore
 
-        return temp_flight.merge(agg_data, left_on="rounded", right_index=True)
+        return temp_flight._merge_rounded(agg_data)
 
     def agg_time(
         self, freq: str = "1 min", merge: bool = True, **kwargs: Any
@@ -1656,9 +1888,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         if len(kwargs) == 0:
             raise RuntimeError("No feature provided for aggregation.")
-        temp_flight = self.assign(
-            rounded=lambda df: df.timestamp.dt.round(freq)
-        )
+        temp_flight = self.assign(rounded=self._rounded_timestamp(freq))
 
         # force the agg_data to be multi-indexed in columns
         kwargs_modified: Dict["str", List[Any]] = dict(
@@ -1677,7 +1907,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             # debugging purposes
             return agg_data  # type: ignore
 
-        return temp_flight.merge(agg_data, left_on="rounded", right_index=True)
+        return temp_flight._merge_rounded(agg_data)
 
     def handle_last_position(self) -> Flight:
         # The following is True for all data coming from the Impala shell.
@@ -1703,6 +1933,21 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         return self.__class__(data)
 
+    def _centred_projection(self, proj: str) -> pyproj.Proj:
+        lon_unwrap = np.degrees(
+            np.unwrap(np.radians(self.data.longitude.dropna()))
+        )
+        return pyproj.Proj(
+            proj=proj,
+            ellps="WGS84",
+            lat_0=self.data.latitude.mean(),
+            lat_1=self.data.latitude.min(),
+            lat_2=self.data.latitude.max(),
+            lon_0=lon_unwrap.mean(),
+            lon_1=lon_unwrap.min(),
+            lon_2=lon_unwrap.max(),
+        )
+
     def resample(
         self,
         rule: str | int = "1s",
@@ -1756,32 +2001,12 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         """
         if projection is not None:
             if isinstance(projection, str):
-                lon_unwrap = np.degrees(
-                    np.unwrap(np.radians(self.data.longitude.dropna()))
-                )
-                lon0 = lon_unwrap.mean()
-                lon1 = lon_unwrap.min()
-                lon2 = lon_unwrap.max()
-                projection = pyproj.Proj(
-                    proj=projection,
-                    ellps="WGS84",
-                    lat_0=self.data.latitude.mean(),
-                    lat_1=self.data.latitude.min(),
-                    lat_2=self.data.latitude.max(),
-                    lon_0=lon0,
-                    lon_1=lon1,
-                    lon_2=lon2,
-                )
+                projection = self._centred_projection(projection)
             self = self.compute_xy(projection=projection)
 
         if isinstance(rule, str):
-            data = (
-                self.handle_last_position()
-                .unwrap()
-                .data.set_index("timestamp")
-                .resample(rule)
-                .first()
-                .reset_index(names="timestamp")
+            data = _resample_first(
+                self.handle_last_position().unwrap().data, rule
             )
 
             data = data.infer_objects(copy=False)
@@ -1835,6 +2060,77 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         return res
 
+    @impunity(ignore_warnings=True)
+    def resample_cumdist(
+        self,
+        rule: str = "1s",
+        projection: Union[None, str, pyproj.Proj, "crs.Projection"] = None,
+    ) -> "Flight":
+        """Resample the positions of the trajectory and compute the
+        cumulative distance along the resampled trajectory.
+
+        This is a lightweight alternative to
+        ``flight.resample(rule).cumulative_distance()`` when only positions
+        matter: other columns are dropped, and the ``cumdist`` column (in
+        **nautical miles**) is computed in the same pass.
+
+        Results are close to, but not identical with, the ones of
+        :meth:`resample`: latitude and longitude are linearly interpolated
+        at the instants of the time grid defined by ``rule``, whereas
+        :meth:`resample` keeps the first sample of each bin before
+        interpolating the empty ones.
+
+        :param rule: a :ref:`pandas:timeseries.offset_aliases` for the time
+            frequency of the resampled trajectory.
+
+        :param projection: (default: ``None``) see :meth:`resample`.
+
+        """
+        from cartopy import crs
+
+        xyz, t_epoch = self._xyz, self._t_epoch
+        if np.any(t_epoch[1:] < t_epoch[:-1]):  # np.interp expects sorted x
+            order = np.argsort(t_epoch, kind="stable")
+            xyz, t_epoch = xyz[order], t_epoch[order]
+        grid = pd.date_range(
+            self.start.floor(rule), self.stop, freq=rule, name="timestamp"
+        )
+        t_grid = grid.asi8
+
+        if projection is None:
+            lon = np.interp(t_grid, t_epoch, xyz[:, 0])
+            lat = np.interp(t_grid, t_epoch, xyz[:, 1])
+        else:
+            if isinstance(projection, str):
+                projection = self._centred_projection(projection)
+            if isinstance(projection, crs.Projection):
+                projection = pyproj.Proj(projection.proj4_init)
+            x, y = projection(xyz[:, 0], xyz[:, 1])
+            lon, lat = projection(
+                np.interp(t_grid, t_epoch, x),
+                np.interp(t_grid, t_epoch, y),
+                inverse=True,
+            )
+
+        _, dist = _geodesic_steps(lat, lon)
+        distance_m: Annotated[Any, "m"] = dist
+        distance_nm: tt.distance_array = distance_m
+
+        data = pd.DataFrame(
+            {
+                "timestamp": grid,
+                "latitude": lat,
+                "longitude": lon,
+                "cumdist": np.pad(distance_nm.cumsum(), (1, 0), "constant"),
+            }
+        )
+        metadata = dict(icao24=self.icao24, callsign=self.callsign)
+        return self.__class__(
+            data.assign(
+                **{k: v for k, v in metadata.items() if isinstance(v, str)}
+            )
+        )
+
     def filter(
         self,
         filter: Literal["default", "aggressive"]
@@ -2045,12 +2341,12 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         for feature in features:
             if feature not in reset.data.columns:
                 continue
-            series = reset.data[feature].astype(float)
-            idx = ~series.isnull()
-            result_dict[f"{feature}_unwrapped"] = pd.Series(
-                np.degrees(np.unwrap(np.radians(series.loc[idx]))),
-                index=series.loc[idx].index,
-            )
+            values = reset.data[feature].to_numpy(dtype=float, na_value=np.nan)
+            valid = ~np.isnan(values)
+            # unwrapping directly in degrees avoids two conversion passes
+            unwrapped = np.full_like(values, np.nan)
+            unwrapped[valid] = np.unwrap(values[valid], period=360)
+            result_dict[f"{feature}_unwrapped"] = unwrapped
 
         return reset.assign(**result_dict)
 
@@ -2682,7 +2978,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         return method.apply(self)
 
-    @flight_iterator
+    @_deprecated_iterator("landing")
     def aligned_on_ils(
         self,
         airport: Union[str, "Airport"],
@@ -2690,19 +2986,15 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         min_duration: deltalike = "1 min",
         max_ft_above_airport: float = 5000,
     ) -> Iterator["Flight"]:  # DEPRECATED
-        from ..algorithms.navigation.landing import LandingAlignedOnILS
-
-        warnings.warn(
-            "Deprecated aligned_on_ils method, use .landing() instead",
-            DeprecationWarning,
+        yield from self.landing(
+            airport,
+            angle_tolerance,
+            min_duration,
+            max_ft_above_airport,
+            method="aligned_on_ils",
         )
 
-        method = LandingAlignedOnILS(
-            airport, angle_tolerance, min_duration, max_ft_above_airport
-        )
-        yield from method.apply(self)
-
-    @flight_iterator
+    @_deprecated_iterator("takeoff")
     def takeoff_from_runway(
         self,
         airport: Union[str, "Airport"],
@@ -2711,19 +3003,16 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         little_base: int = 50,
         opening: float = 5,
     ) -> Iterator["Flight"]:  # DEPRECATED
-        from ..algorithms.navigation.takeoff import PolygonBasedRunwayDetection
-
-        warnings.warn(
-            "Deprecated takeoff_from_runway method, use .takeoff() instead",
-            DeprecationWarning,
+        yield from self.takeoff(
+            airport,
+            max_ft_above_airport,
+            zone_length,
+            little_base,
+            opening,
+            method="polygon_based",
         )
 
-        method = PolygonBasedRunwayDetection(
-            airport, max_ft_above_airport, zone_length, little_base, opening
-        )
-        yield from method.apply(self)
-
-    @flight_iterator
+    @_deprecated_iterator("aligned")
     def aligned_on_navpoint(
         self,
         points: Union[str, "PointLike", Iterable["PointLike"]],
@@ -2732,33 +3021,20 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         min_time: str = "30s",
         min_distance: int = 80,
     ) -> Iterator["Flight"]:  # DEPRECATED
-        from ..algorithms.navigation.alignment import (
-            BeaconTrackBearingAlignment,
-        )
-
-        warnings.warn(
-            "Deprecated aligned_on_navpoint method, use .aligned() instead",
-            DeprecationWarning,
-        )
-
-        method = BeaconTrackBearingAlignment(
-            points, angle_precision, time_precision, min_time, min_distance
+        yield from self.aligned(
+            points,
+            angle_precision,
+            time_precision,
+            min_time,
+            min_distance,
+            method="beacon",
         )
-        yield from method.apply(self)
 
-    @flight_iterator
+    @_deprecated_iterator("aligned")
     def aligned_on_runway(
         self, airport: str | Airport
     ) -> Iterator["Flight"]:  # DEPRECATED
-        from ..algorithms.ground.runway import RunwayAlignment
-
-        warnings.warn(
-            "Deprecated aligned_on_runway method, use .aligned() instead",
-            DeprecationWarning,
-        )
-
-        method = RunwayAlignment(airport=airport)
-        yield from method.apply(self)
+        yield from self.aligned(airport=airport, method="runway")
 
     # -- End of navigation and ground methods --
 
@@ -2781,19 +3057,14 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         corresponding fuel flow class.
 
         """
-        from ..algorithms.performance import EstimatorBase, openap
+        from ..algorithms.performance import EstimatorBase
 
         if len(args) and isinstance(args[0], EstimatorBase):
             method = args[0]
-            args = tuple(*args[1:])
-
-        method_dict = dict(
-            default=openap.FuelflowEstimation,
-            openap=openap.FuelflowEstimation,
-        )
+            args = args[1:]
 
         method = (
-            method_dict[method](*args, **kwargs)
+            _fuelflow_methods()[method](*args, **kwargs)
             if isinstance(method, str)
             else method
         )
@@ -2817,19 +3088,14 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         corresponding fuel flow class.
 
         """
-        from ..algorithms.performance import openap
+        from ..algorithms.performance import EstimatorBase
 
         if len(args) and isinstance(args[0], EstimatorBase):
             method = args[0]
-            args = tuple(*args[1:])
-
-        method_dict = dict(
-            default=openap.PollutantEstimation,
-            openap=openap.PollutantEstimation,
-        )
+            args = args[1:]
 
         method = (
-            method_dict[method](*args, **kwargs)
+            _emission_methods()[method](*args, **kwargs)
             if isinstance(method, str)
             else method
         )
@@ -2876,29 +3142,23 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         """
 
-        from cartopy.crs import PlateCarree
-
         if "projection" in ax.__dict__ and "transform" not in kwargs:
-            kwargs["transform"] = PlateCarree()
+            kwargs["transform"] = _platecarree()
 
         if any(w not in self.data.columns for w in ["wind_u", "wind_v"]):
             raise RuntimeError(
                 "No wind data in trajectory. Consider Flight.compute_wind()"
             )
 
-        copy_self: Optional[Flight] = self
+        copy_self: Flight = self
 
         if filtered:
-            copy_self = self.filter(roll=17)
-            if copy_self is None:
+            # filter all features at once, then keep wings-level points
+            copy_self = self.filter(roll=17, wind_u=17, wind_v=17)
+            mask = copy_self.data.roll.abs() < 0.5
+            if not mask.any():
                 return []
-            copy_self = copy_self.query("roll.abs() < .5")
-            if copy_self is None:
-                return []
-            copy_self = copy_self.filter(wind_u=17, wind_v=17)
-
-        if copy_self is None:
-            return []
+            copy_self = self.__class__(copy_self.data.loc[mask])
 
         if resolution is not None:
             if isinstance(resolution, (int, str)):
@@ -2909,18 +3169,44 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
                 r_lon = resolution.get("longitude", None)
 
                 if r_lat is not None and r_lon is not None:
-                    data = (
-                        copy_self.assign(
-                            latitude=lambda x: (
-                                (r_lat * x.latitude).round() / r_lat
-                            ),
-                            longitude=lambda x: (
-                                (r_lon * x.longitude).round() / r_lon
-                            ),
+                    # bin positions on the grid, then average wind components
+                    # per bin with bincount rather than a pandas groupby
+                    lat_k = np.round(
+                        r_lat * copy_self.data.latitude.to_numpy(np.float64)
+                    )
+                    lon_k = np.round(
+                        r_lon * copy_self.data.longitude.to_numpy(np.float64)
+                    )
+                    valid = ~(np.isnan(lat_k) | np.isnan(lon_k))
+                    keys, inverse = np.unique(
+                        np.stack([lat_k[valid], lon_k[valid]]),
+                        axis=1,
+                        return_inverse=True,
+                    )
+                    inverse = inverse.ravel()
+
+                    def bin_mean(feature: str) -> np.ndarray:
+                        values = copy_self.data[feature].to_numpy(np.float64)
+                        values = values[valid]
+                        notna = ~np.isnan(values)
+                        total = np.bincount(
+                            inverse[notna],
+                            weights=values[notna],
+                            minlength=keys.shape[1],
+                        )
+                        count = np.bincount(
+                            inverse[notna], minlength=keys.shape[1]
+                        )
+                        with np.errstate(invalid="ignore"):
+                            return total / count
+
+                    data = pd.DataFrame(
+                        dict(
+                            latitude=keys[0] / r_lat,
+                            longitude=keys[1] / r_lon,
+                            wind_u=bin_mean("wind_u"),
+                            wind_v=bin_mean("wind_v"),
                         )
-                        .groupby(["latitude", "longitude"])
-                        .agg(dict(wind_u="mean", wind_v="mean"))
-                        .reset_index()
                     )
 
         return ax.barbs(  # type: ignore
@@ -2933,20 +3219,30 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
     # -- Distances --
 
+    @cached_property
+    def _latlon_np(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Flight methods return new instances, so the cache lives as long
+        # as the underlying DataFrame
+        return (
+            self.data.latitude.to_numpy(),
+            self.data.longitude.to_numpy(),
+        )
+
+    @cached_property
+    def _xy_cache(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        # projected coordinates, indexed by the srs of the projection
+        return {}
+
     def bearing(self, other: PointLike, column_name: str = "bearing") -> Flight:
         # temporary, should implement full stuff
-        size = self.data.shape[0]
-        return self.assign(
-            **{
-                column_name: geo.bearing(
-                    self.data.latitude.to_numpy(),
-                    self.data.longitude.to_numpy(),
-                    (other.latitude * np.ones(size)).astype(np.float64),
-                    (other.longitude * np.ones(size)).astype(np.float64),
-                )
-                % 360
-            }
+        lat, lon = self._latlon_np
+        track, _ = _geodesic_inv(
+            lat,
+            lon,
+            np.full(lat.shape, other.latitude, dtype=np.float64),
+            np.full(lon.shape, other.longitude, dtype=np.float64),
         )
+        return self.assign(**{column_name: np.mod(track, 360.0)})
 
     @overload
     def distance(
@@ -2962,7 +3258,11 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
     @overload
     def distance(
-        self, other: Flight, column_name: str = "distance"
+        self,
+        other: Flight,
+        column_name: str = "distance",
+        *,
+        tolerance: None | deltalike = None,
     ) -> Optional[pd.DataFrame]: ...
 
     @impunity(ignore_warnings=True)
@@ -2970,6 +3270,8 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         self,
         other: Union[None, "Flight", "Airspace", Polygon, PointLike] = None,
         column_name: str = "distance",
+        *,
+        tolerance: None | deltalike = None,
     ) -> Union[None, float, "Flight", pd.DataFrame]:
         """Computes the distance from a Flight to another entity.
 
@@ -2984,6 +3286,9 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
           DataFrame with corresponding data from both flights, aligned
           with their timestamps, and two new columns with `lateral` and
           `vertical` distances (resp. in nm and ft) separating them.
+          By default, only identical timestamps are matched; if a
+          ``tolerance`` is passed (e.g. ``"1s"``), each timestamp is matched
+          to the nearest timestamp of the other flight within that tolerance.
 
         - otherwise, the same Flight is returned enriched with a new
           column (by default, named "distance") with the distance of each
@@ -2991,11 +3296,8 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         .. warning::
 
-            - An Airspace is (currently) considered as its flattened
-              representation
-            - Computing a distance to a polygon is quite slow at the moment.
-              Consider a strict resampling (e.g. one point per minute, "1 min")
-              before calling the method.
+            An Airspace is (currently) considered as its flattened
+            representation.
 
         """
 
@@ -3019,9 +3321,10 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         if isinstance(other, PointLike):
             size = self.data.shape[0]
+            lat, lon = self._latlon_np
             distance_vec = geo.distance(
-                self.data.latitude.to_numpy(),
-                self.data.longitude.to_numpy(),
+                lat,
+                lon,
                 (other.latitude * np.ones(size)).astype(np.float64),
                 (other.longitude * np.ones(size)).astype(np.float64),
             )
@@ -3048,18 +3351,19 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             )
             projected_shape = transform(transformer.transform, other)
 
-            self_xy = self.compute_xy(projection)
-
+            xy = self._xy_cache.get(projection.srs)
+            if xy is None:
+                self_xy = self.compute_xy(projection)
+                xy = self_xy.data.x.to_numpy(), self_xy.data.y.to_numpy()
+                self._xy_cache[projection.srs] = xy
+
+            # one vectorized GEOS call for all points, negative inside
+            points = shapely.points(*xy)
+            shapely.prepare(projected_shape)
+            distance = shapely.distance(projected_shape.exterior, points)
+            inside = shapely.contains(projected_shape, points)
             return self.assign(
-                **{
-                    column_name: list(
-                        projected_shape.exterior.distance(p)
-                        * (-1 if projected_shape.contains(p) else 1)
-                        for p in MultiPoint(
-                            list(zip(self_xy.data.x, self_xy.data.y))
-                        ).geoms
-                    )
-                }
+                **{column_name: np.where(inside, -distance, distance)}
             )
 
         assert isinstance(other, Flight)
@@ -3074,7 +3378,25 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             cols.append("callsign")
         if "flight_id" in f1.data.columns:
             cols.append("flight_id")
-        table = f1.data[cols].merge(f2.data[cols], on="timestamp")
+        if tolerance is None:
+            table = f1.data[cols].merge(f2.data[cols], on="timestamp")
+        else:
+            # merge_asof rejects null keys
+            left = f1.data[cols].dropna(subset="timestamp")
+            right = f2.data[cols].dropna(subset="timestamp")
+            table = pd.merge_asof(
+                left.sort_values("timestamp"),
+                right.assign(_matched=True).sort_values("timestamp"),
+                on="timestamp",
+                tolerance=to_timedelta(tolerance),
+                direction="nearest",
+                suffixes=("_x", "_y"),
+            )
+            table = (
+                table.loc[table._matched.notna()]
+                .drop(columns="_matched")
+                .reset_index(drop=True)
+            )
 
         distance_vec = geo.distance(
             table.latitude_x.to_numpy(),
@@ -3112,21 +3434,42 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             "Lelystad Airport, 49.11m"
 
         """
-        from .distance import closest_point
-
         if not isinstance(points, list):
             points = [points]
 
-        return min(
-            (closest_point(self.data, point) for point in points),
-            key=attrgetter("distance"),
+        # one pass over the trajectory: distances to all points at once,
+        # shape (len(points), len(self)); argmin keeps the ordering of ties
+        lat, lon = self._latlon_np
+        lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+            lat[None, :],
+            lon[None, :],
+            np.array([p.latitude for p in points], dtype=np.float64)[:, None],
+            np.array([p.longitude for p in points], dtype=np.float64)[:, None],
+        )
+        dist_matrix = geo.distance(lat1, lon1, lat2, lon2)
+        # argmin would select the first NaN: skip points with no position
+        point_idx, argmin = np.unravel_index(
+            np.where(np.isnan(dist_matrix), np.inf, dist_matrix).argmin(),
+            dist_matrix.shape,
+        )
+        elt = self.data.iloc[argmin]
+        return pd.Series(
+            {
+                **dict(elt),
+                **{
+                    "distance": dist_matrix[point_idx, argmin],
+                    "point": points[point_idx].name,
+                },
+            },
+            name=elt.name,
         )
 
+    @impunity(ignore_warnings=True)
     def compute_DME_NSE(
         self,
         dme: "Navaids" | Tuple["Navaid", "Navaid"],
         column_name: str = "NSE",
-    ) -> Flight:
+    ) -> "Flight":
         """Adds the DME/DME Navigation System Error.
 
         Computes the max Navigation System Error using DME-DME navigation. The
@@ -3149,84 +3492,58 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         from ..data.basic.navaid import Navaids
 
-        sigma_dme_1_sis = sigma_dme_2_sis = 0.05
-
-        def sigma_air(df: pd.DataFrame, column_name: str) -> Any:
-            values = df[column_name] * 0.125 / 100
-            return np.where(values < 0.085, 0.085, values)
-
-        def angle_from_bearings_deg(
-            bearing_1: float, bearing_2: float
-        ) -> float:
-            # Returns the subtended given by 2 bearings.
-            angle = np.abs(bearing_1 - bearing_2)
-            return np.where(angle > 180, 360 - angle, angle)  # type: ignore
-
-        if isinstance(dme, Navaids):
-            flight = reduce(
-                lambda flight, dme_pair: flight.compute_DME_NSE(
-                    dme_pair, f"nse_{dme_pair[0].name}_{dme_pair[1].name}"
-                ),
-                combinations(dme, 2),
-                self,
-            )
-            nse_colnames = list(
-                column
-                for column in flight.data.columns
-                if column.startswith("nse_")
-            )
-            return (
-                flight.assign(
-                    NSE=lambda df: df[nse_colnames].min(axis=1),
-                    NSE_idx=lambda df: df[nse_colnames].idxmin(axis=1).str[4:],
-                )
-                .rename(
-                    columns=dict(
-                        NSE=column_name,
-                        NSE_idx=f"{column_name}_idx",
-                    )
-                )
-                .drop(columns=nse_colnames)
-            )
-
-        dme1, dme2 = dme
-        extra_cols = [
-            "b1",
-            "b2",
-            "d1",
-            "d2",
-            "sigma_dme_1_air",
-            "sigma_dme_2_air",
-            "angle",
-        ]
-
-        return (
-            self.distance(dme1, "d1")
-            .bearing(dme1, "b1")
-            .distance(dme2, "d2")
-            .bearing(dme2, "b2")
-            .assign(angle=lambda df: angle_from_bearings_deg(df.b1, df.b2))
-            .assign(
-                angle=lambda df: np.where(
-                    (df.angle >= 30) & (df.angle <= 150), df.angle, np.nan
-                )
-            )
-            .assign(
-                sigma_dme_1_air=lambda df: sigma_air(df, "d1"),
-                sigma_dme_2_air=lambda df: sigma_air(df, "d2"),
-                NSE=lambda df: (
-                    2
-                    * np.sqrt(
-                        df.sigma_dme_1_air**2
-                        + df.sigma_dme_2_air**2
-                        + sigma_dme_1_sis**2
-                        + sigma_dme_2_sis**2
-                    )
-                )
-                / np.sin(np.deg2rad(df.angle)),
-            )
-            .drop(columns=extra_cols)
-            .rename(columns=dict(NSE=column_name))
+        navaids = list(dme)
+        if len(navaids) < 2:
+            raise ValueError("At least two DME are needed to compute the NSE")
+
+        # ranges and bearings to all DME come from a single inverse geodesic
+        # problem, with one row per DME
+        lat, lon = self._latlon_np
+        lat_dme = np.array([n.latitude for n in navaids], dtype=np.float64)
+        lon_dme = np.array([n.longitude for n in navaids], dtype=np.float64)
+        shape = (len(navaids), lat.shape[0])
+        b, dist = _geodesic_inv(
+            np.broadcast_to(lat, shape).ravel(),
+            np.broadcast_to(lon, shape).ravel(),
+            np.broadcast_to(lat_dme[:, None], shape).ravel(),
+            np.broadcast_to(lon_dme[:, None], shape).ravel(),
+        )
+        distance_m: Annotated[Any, "m"] = dist.reshape(shape)
+        d: tt.distance_array = distance_m
+        b = b.reshape(shape)
+
+        if not isinstance(dme, Navaids):
+            nse_pair = _dme_nse(d[0], b[0], d[1], b[1])
+            return self.assign(**{column_name: nse_pair})
+
+        # pairs in the same order as itertools.combinations, evaluated by
+        # chunks of rows to keep memory bounded with many DME
+        i, j = np.triu_indices(len(navaids), k=1)
+        labels = np.array(
+            [f"{navaids[x].name}_{navaids[y].name}" for x, y in zip(i, j)],
+            dtype=object,
+        )
+        size = lat.shape[0]
+        nse_min = np.full(size, np.inf)
+        best = np.full(size, -1)
+        step = max(1, _DME_NSE_CHUNK // max(size, 1))
+        for start in range(0, i.shape[0], step):
+            ci, cj = i[start : start + step], j[start : start + step]
+            nse = _dme_nse(d[ci], b[ci], d[cj], b[cj])
+            nse = np.where(np.isnan(nse), np.inf, nse)
+            chunk_best = nse.argmin(axis=0)
+            chunk_min = nse[chunk_best, np.arange(size)]
+            # strict comparison: the first pair wins in case of a tie
+            better = chunk_min < nse_min
+            nse_min[better] = chunk_min[better]
+            best[better] = start + chunk_best[better]
+
+        valid = best >= 0
+        return self.assign(
+            **{
+                column_name: np.where(valid, nse_min, np.nan),
+                f"{column_name}_idx": np.where(valid, labels[best], np.nan),
+            }
         )
 
     @impunity(ignore_warnings=True)
@@ -3259,42 +3576,37 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             warnings.warn("Use compute_gs argument", DeprecationWarning)
             compute_gs = kwargs["compute_groundspeed"]
 
-        cur_sorted = self.sort_values("timestamp", ascending=not reverse)
-        coords = cur_sorted.data[["timestamp", "latitude", "longitude"]]
+        if not reverse and self.data.timestamp.is_monotonic_increasing:
+            cur_sorted = self
+        else:
+            cur_sorted = self.sort_values("timestamp", ascending=not reverse)
+        data = cur_sorted.data
+        lat = data.latitude.to_numpy(dtype=np.float64, na_value=np.nan)
+        lon = data.longitude.to_numpy(dtype=np.float64, na_value=np.nan)
 
-        delta = pd.concat([coords, coords.add_suffix("_1").diff()], axis=1)
-        delta_1 = delta.iloc[1:]
-        distance_nm: tt.distance_array
-        distance_nm = geo.distance(
-            (delta_1.latitude - delta_1.latitude_1).to_numpy(),
-            (delta_1.longitude - delta_1.longitude_1).to_numpy(),
-            delta_1.latitude.to_numpy(),
-            delta_1.longitude.to_numpy(),
-        )
+        # a single inverse geodesic problem yields both distance and track
+        track, dist = _geodesic_steps(lat, lon)
+        distance_m: Annotated[Any, "m"] = dist
+        distance_nm: tt.distance_array = distance_m
 
         res = cur_sorted.assign(
             cumdist=np.pad(distance_nm.cumsum(), (1, 0), "constant")
         )
 
         if compute_gs:
-            secs: tt.seconds_array = delta_1.timestamp_1.dt.total_seconds()
+            timestamp = data.timestamp.to_numpy(dtype="datetime64[ns]")
+            secs: tt.seconds_array = np.diff(timestamp.astype(np.int64)) / 1e9
             groundspeed: tt.speed_array = distance_nm / secs
             res = res.assign(
                 compute_gs=np.abs(np.pad(groundspeed, (1, 0), "edge"))
             )
 
         if compute_track:
-            track = geo.bearing(
-                (delta_1.latitude - delta_1.latitude_1).to_numpy(),
-                (delta_1.longitude - delta_1.longitude_1).to_numpy(),
-                delta_1.latitude.to_numpy(),
-                delta_1.longitude.to_numpy(),
-            )
-            track = np.where(track > 0, track, 360 + track)
-            res = res.assign(
-                compute_track=np.abs(np.pad(track, (1, 0), "edge"))
-            )
+            track = np.mod(track, 360.0)
+            res = res.assign(compute_track=np.pad(track, (1, 0), "edge"))
 
+        if not reverse:  # already in ascending order
+            return res
         return res.sort_values("timestamp", ascending=True)
 
     # -- Geometry operations --
@@ -3304,10 +3616,9 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         # longitude is implicit I guess
         if "latitude" not in self.data.columns:
             return None
-        coords = list(self.coords)
-        if len(coords) < 2:
+        if len(self._xyz) < 2:
             return None
-        return LineString(coords)
+        return LineString(self._xyz)
 
     @property
     def shape(self) -> Optional[LineString]:
@@ -3371,14 +3682,19 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
     def clip_iterate(
         self, shape: Union[ShapelyMixin, base.BaseGeometry], strict: bool = True
     ) -> Iterator["Flight"]:
-        list_coords = list(self.xy_time)
-        if len(list_coords) < 2:
+        xyz = self._xyz
+        if len(xyz) < 2:
             return None
 
-        linestring = LineString(list_coords)
+        linestring = LineString(self._xy_time)
         if not isinstance(shape, base.BaseGeometry):
             shape = shape.shape
 
+        # cheap rejection before the intersection, faster still if the shape
+        # comes prepared (e.g. Airspace.shape)
+        if not shapely.intersects(shape, linestring):
+            return None
+
         intersection = linestring.intersection(shape)
 
         if intersection.is_empty:
@@ -3387,25 +3703,21 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         if isinstance(intersection, Point):
             return None
 
-        if isinstance(intersection, LineString):
-            time_list = list(
-                datetime.fromtimestamp(t, timezone.utc)
-                for t in np.stack(intersection.coords)[:, 2]
-            )
-            between = self.between(
-                min(time_list), max(time_list), strict=strict
-            )
-            if between is not None:
-                yield between
-            return None
+        # time bounds of each part of the intersection, without iterating
+        # over their coordinates in Python
+        coords, index = shapely.get_coordinates(
+            shapely.get_parts(intersection), include_z=True, return_index=True
+        )
+        first = np.r_[0, np.flatnonzero(np.diff(index)) + 1]
+        t_min = np.minimum.reduceat(coords[:, 2], first)
+        t_max = np.maximum.reduceat(coords[:, 2], first)
 
         def _clip_generator() -> Iterable[Tuple[datetime, datetime]]:
-            for segment in intersection.geoms:
-                times: List[datetime] = list(
-                    datetime.fromtimestamp(t, timezone.utc)
-                    for t in np.stack(segment.coords)[:, 2]
+            for t1, t2 in zip(t_min, t_max):
+                yield (
+                    datetime.fromtimestamp(t1, timezone.utc),
+                    datetime.fromtimestamp(t2, timezone.utc),
                 )
-                yield min(times), max(times)
 
         # it is actually not so simple because of self intersecting trajectories
         prev_t1, prev_t2 = None, None
@@ -3515,20 +3827,24 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         from ..data import opensky
 
-        if not isinstance(self.icao24, str):
+        # properties scan the data: only evaluate them once
+        icao24, callsign = self.icao24, self.callsign
+        start, stop = self.start, self.stop
+
+        if not isinstance(icao24, str):
             raise RuntimeError("Several icao24 for this flight")
 
-        if self.callsign is None:
+        if callsign is None:
             raise RuntimeError("No callsign for this flight")
 
-        if not isinstance(self.callsign, str):
+        if not isinstance(callsign, str):
             raise RuntimeError("Several callsigns for this flight")
 
         def fail_warning() -> Flight:
             """Called when nothing can be added to data."""
             id_ = self.flight_id
             if id_ is None:
-                id_ = self.callsign
+                id_ = callsign
             _log.warning(f"No data found on OpenSky database for flight {id_}.")
             return self
 
@@ -3536,7 +3852,7 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             """Called when nothing can be added to data."""
             id_ = self.flight_id
             if id_ is None:
-                id_ = self.callsign
+                id_ = callsign
             _log.info(f"No data found on OpenSky database for flight {id_}.")
             return self
 
@@ -3549,74 +3865,48 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         failure = failure_dict[failure_mode]
 
         if data is None:
-            ext = opensky.extended(
-                self.start, self.stop, icao24=self.icao24, **kwargs
-            )
+            ext = opensky.extended(start, stop, icao24=icao24, **kwargs)
             df = ext.data if ext is not None else None
         else:
             df = data if isinstance(data, pd.DataFrame) else data.data
             df = df.query(
-                "icao24 == @self.icao24 and "
-                "@self.start.timestamp() < mintime < @self.stop.timestamp()"
+                "icao24 == @icao24 and "
+                "@start.timestamp() < mintime < @stop.timestamp()"
             )
 
         if df is None or df.shape[0] == 0:
             return failure()
 
-        timestamped_df = df.sort_values("mintime").assign(
-            timestamp=lambda df: df.mintime
-        )
-        timestamp_s = self.data.timestamp.dt.as_unit("s").astype(int)
-
-        referenced_df = (
-            timestamped_df.merge(
-                self.data.assign(timestamp=timestamp_s),
-                on="timestamp",
-                how="outer",
-            )
-            .sort_values("timestamp")
-            .rename(
-                columns=dict(
-                    altitude="alt",
-                    altitude_y="alt",
-                    groundspeed="spd",
-                    track="trk",
-                )
-            )[["timestamp", "latitude", "longitude", "alt", "spd", "trk"]]
-            .ffill()
-            .drop_duplicates()  # bugfix! NEVER ERASE THAT LINE!
-            .merge(
-                timestamped_df[["timestamp", "icao24", "rawmsg"]],
-                on="timestamp",
-                how="right",
-            )
-        )
-
+        # rs1090 only needs the messages and their timestamps (in seconds)
+        df = df.sort_values("mintime")
         decoded = rs1090.decode(
-            referenced_df.rawmsg,
-            referenced_df.timestamp.astype("int64"),
+            df.rawmsg.tolist(), df.mintime.astype("int64").tolist()
         )
 
         if len(decoded) == 0:
             return failure()
 
-        df = pd.concat(
-            # 5000 is a good batch size for fast loading!
-            pd.DataFrame.from_records(d)
-            for d in rs1090.batched(decoded, 5000)
+        # pa.array() unifies the keys of all records (from_pylist would only
+        # look at the first one) and builds all columns in a single pass
+        table = pa.Table.from_struct_array(pa.array(decoded))
+        i = table.schema.get_field_index("timestamp")
+        timestamp = pc.multiply(table.column(i), 1e9).cast(pa.int64())
+        table = table.set_column(
+            i, "timestamp", timestamp.cast(pa.timestamp("ns", tz="UTC"))
         )
-        df = df.convert_dtypes(dtype_backend="pyarrow").assign(
-            timestamp=pd.to_datetime(df.timestamp, unit="s", utc=True)
+        # match the timestamp dtype of self so that both concatenate cleanly
+        df = table.to_pandas(types_mapper=pd.ArrowDtype).astype(
+            {"timestamp": self.data.timestamp.dtype}
         )
         extended = Flight(df)
 
         # fix for https://stackoverflow.com/q/53657210/1595335
-        if "last_position" in self.data.columns:
-            extended = extended.assign(last_position=pd.NaT)
-        if "start" in self.data.columns:
-            extended = extended.assign(start=pd.NaT)
-        if "stop" in self.data.columns:
-            extended = extended.assign(stop=pd.NaT)
+        columns = set(self.data.columns)
+        nat_columns = [
+            c for c in ("last_position", "start", "stop") if c in columns
+        ]
+        if nat_columns:
+            extended = extended.assign(**dict.fromkeys(nat_columns, pd.NaT))
 
         aggregate = extended + self
         if "flight_id" in self.data.columns:
@@ -3624,18 +3914,22 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         # sometimes weird callsigns are decoded and should be discarded
         # so it seems better to filter on callsign rather than on icao24
-        flight = aggregate[self.icao24]
-        if flight is None:
+        mask = (aggregate.data.icao24 == icao24).to_numpy(
+            dtype=bool, na_value=False
+        )
+        if not mask.any():
             return failure()
+        flight = Flight(aggregate.data.loc[mask])
 
-        if self.callsign is not None:
-            flight = flight.assign(callsign=self.callsign)
-        if self.number is not None:
-            flight = flight.assign(number=self.number)
-        if self.origin is not None:
-            flight = flight.assign(origin=self.origin)
-        if self.destination is not None:
-            flight = flight.assign(destination=self.destination)
+        metadata = dict(
+            callsign=callsign,
+            number=self.number,
+            origin=self.origin,
+            destination=self.destination,
+        )
+        flight = flight.assign(
+            **{key: val for key, val in metadata.items() if val is not None}
+        )
 
         return flight.sort_values("timestamp")
 
@@ -3666,10 +3960,8 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
         """
 
-        from cartopy.crs import PlateCarree
-
         if "projection" in ax.__dict__ and "transform" not in kwargs:
-            kwargs["transform"] = PlateCarree()
+            kwargs["transform"] = _platecarree()
         if self.shape is not None:
             return ax.plot(*self.shape.xy, **kwargs)  # type: ignore
         return []
@@ -3837,7 +4129,13 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
 
             ax = plt.gca()
 
-        localized = self.data.timestamp.dt.tz is not None
+        timestamp = self.data.timestamp
+        if timestamp.dt.tz is None:
+            timestamp = timestamp.dt.tz_localize(
+                datetime.now(tz=None).astimezone().tzinfo
+            )
+        data = self.data.assign(timestamp=timestamp.dt.tz_convert("utc"))
+
         for column in y:
             kw = {
                 **kwargs,
@@ -3846,22 +4144,8 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
                     secondary_y=column if column in secondary_y else "",
                 ),
             }
-            subtab = self.data.query(f"{column}.notnull()")
-
-            if localized:
-                (
-                    subtab.assign(
-                        timestamp=lambda df: df.timestamp.dt.tz_convert("utc")
-                    ).plot(ax=ax, x="timestamp", **kw)
-                )
-            else:
-                (
-                    subtab.assign(
-                        timestamp=lambda df: df.timestamp.dt.tz_localize(
-                            datetime.now(tz=None).astimezone().tzinfo
-                        ).dt.tz_convert("utc")
-                    ).plot(ax=ax, x="timestamp", **kw)
-                )
+            subtab = data.loc[data[column].notna()]
+            subtab.plot(ax=ax, x="timestamp", **kw)
 
     @classmethod
     def from_fr24(cls, filename: Union[Path, str]) -> Flight:
@@ -3898,27 +4182,36 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
             "roll",
         ]
 
-        readsb_data = pd.read_json(filename).rename(columns={"icao": "icao24"})
+        # a trace file is one JSON object: aircraft information and the list
+        # of trace points; broadcast the former over the latter
+        content = json.loads(Path(filename).read_bytes())
         trace_data = pd.DataFrame.from_records(
-            readsb_data.trace, columns=trace_columns
+            content.pop("trace"), columns=trace_columns
+        )
+        readsb_data = pd.DataFrame(content, index=trace_data.index).rename(
+            columns={"icao": "icao24"}
+        )
+        if "year" in readsb_data.columns:  # a string in the file
+            readsb_data["year"] = pd.to_numeric(readsb_data["year"])
+        # only normalize the points carrying an aircraft payload
+        aircraft = trace_data.aircraft.dropna()
+        aircraft_data = (
+            pd.json_normalize(aircraft.tolist(), max_level=1)
+            .set_axis(aircraft.index)
+            .add_prefix("aircraft_")
         )
-        aircraft_data = pd.json_normalize(trace_data.aircraft)
 
         readsb_data = (
             readsb_data.assign(
-                position_time_utc=readsb_data.timestamp
-                + trace_data["seconds_after_timestamp"].map(
-                    lambda s: timedelta(seconds=s)
+                position_time_utc=pd.to_datetime(content["timestamp"], unit="s")
+                + pd.to_timedelta(
+                    trace_data["seconds_after_timestamp"].to_numpy(), unit="s"
                 )
             )
-            .drop(columns=["timestamp", "trace"])
+            .drop(columns=["timestamp"])
             .join(trace_data.drop(columns=["seconds_after_timestamp"]))
             .rename(columns={"position_time_utc": "timestamp"})
-            .join(
-                aircraft_data.rename(
-                    columns={c: "aircraft_" + c for c in aircraft_data.columns}
-                )
-            )
+            .join(aircraft_data)
         )
 
         return cls(readsb_data)
@@ -3962,11 +4255,14 @@ class Flight(HBoxMixin, GeographyMixin, ShapelyMixin, metaclass=MetaFlight):
         if set(tentative.data.columns) != cols_fr24:
             return tentative
 
-        latlon = tentative.data.Position.str.split(pat=",", expand=True)
+        # split in Arrow to avoid intermediate columns of Python strings
+        latlon = pc.split_pattern(pa.array(tentative.data.Position), ",")
+        latitude = pc.list_element(latlon, 0).cast(pa.float64())
+        longitude = pc.list_element(latlon, 1).cast(pa.float64())
         return (
             tentative.assign(
-                latitude=latlon[0].astype(float),
-                longitude=latlon[1].astype(float),
+                latitude=latitude.to_numpy(zero_copy_only=False),
+                longitude=longitude.to_numpy(zero_copy_only=False),
                 timestamp=lambda df: pd.to_datetime(df.UTC),
             )
             .rename(
@@ -268,12 +268,36 @@ class IntervalCollection(DataFrameMixin):
             return sum(interval for interval in cumul)  # type: ignore
 
         if isinstance(other, IntervalCollection):
-            result = self.consolidate()
-            for interval in other.consolidate():
-                result = result - interval  # type: ignore
-                if result is None:
-                    return None
-            return result
+            # A single merge pass over both consolidated collections, sorted
+            # by start: consolidated intervals are disjoint, so stop values
+            # are sorted as well.
+            left = self.consolidate().data.sort_values("start")
+            right = other.consolidate().data.query("start < stop")
+            right = right.sort_values("start")
+            right_start = right["start"].tolist()
+            right_stop = right["stop"].tolist()
+
+            cumul = []
+            j = 0
+            for start, stop in zip(left["start"], left["stop"]):
+                # intervals ending before this segment won't cut later ones
+                while j < len(right_stop) and right_stop[j] <= start:
+                    j += 1
+                cut = False
+                k = j
+                while k < len(right_start) and right_start[k] < stop:
+                    if right_start[k] > start:
+                        cumul.append(Interval(start, right_start[k]))
+                    start = max(start, right_stop[k])
+                    cut = True
+                    k += 1
+                if not cut or start < stop:
+                    cumul.append(Interval(start, stop))
+
+            if len(cumul) == 0:
+                return None
+
+            return IntervalCollection(cumul)
 
         return NotImplemented
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,6 +13,7 @@ from typing import (
 
 import rich.repr
 
+import shapely
 from shapely.geometry import GeometryCollection, LineString
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
@@ -155,11 +156,37 @@ class Airport(FormatMixin, HBoxMixin, PointMixin, ShapelyMixin):
 
     @property
     def shape(self) -> BaseGeometry:
+        return self._shape
+
+    # Cached on the instance: a lru_cache on methods would keep every
+    # Airport alive for the lifetime of the process
+    @cached_property
+    def _shape(self) -> BaseGeometry:
         osm = self._openstreetmap()
         if "aeroway" not in osm.data.columns:
             return GeometryCollection()
         return unary_union(osm.query('type_ != "node"').data.geometry)
 
+    @cached_property
+    def _buffered_shapes(self) -> Dict[float, BaseGeometry]:
+        return {}
+
+    def buffered_shape(self, distance: float) -> BaseGeometry:
+        """Returns the shape of the airport, buffered by a given distance.
+
+        The result is cached and prepared, so that clipping many trajectories
+        against the same area only builds the geometry once.
+
+        >>> airports["EHAM"].buffered_shape(2e-3)  # doctest: +SKIP
+
+        """
+        buffered = self._buffered_shapes.get(distance)
+        if buffered is None:
+            buffered = self.shape.buffer(distance)
+            shapely.prepare(buffered)
+            self._buffered_shapes[distance] = buffered
+        return buffered
+
     @property
     def point(self) -> AirportPoint:
         p = AirportPoint()
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime, timezone  # noqa: F401
+from functools import lru_cache
 from numbers import Real
 
 from pyopensky.time import (
@@ -24,6 +25,13 @@ __all__ = [
 _log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(time: str) -> pd.Timestamp:
+    # The same literals are parsed over and over (e.g. bounds passed to
+    # Flight.between); pd.Timestamp objects are immutable, so share them.
+    return pd.Timestamp(time, tz="utc")
+
+
 def to_datetime(time: timelike) -> pd.Timestamp:
     """Facility to convert anything to a pd.Timestamp.
 
@@ -38,7 +46,7 @@ def to_datetime(time: timelike) -> pd.Timestamp:
     """
 
     if isinstance(time, str):
-        time = pd.Timestamp(time, tz="utc")
+        time = _parse_timestamp(time)
     if isinstance(time, datetime):
         time = pd.Timestamp(time)
     if isinstance(time, Real):
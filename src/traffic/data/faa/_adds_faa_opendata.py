@@ -1,5 +1,6 @@
 import json
 import logging
+from pathlib import Path
 from typing import Any, Dict
 
 import httpx
@@ -33,7 +34,8 @@ class ADDS_FAA_OpenData:
         with self.cache_file.open("w") as fh:
             json.dump(json_contents, fh)
 
-    def json_contents(self) -> Dict[str, Any]:
+    def check_cache(self) -> Path:
+        """Downloads the data if the cache file is missing or expired."""
         if self.cache_file.exists():
             last_modification = (self.cache_file).lstat().st_mtime
             delta = pd.Timestamp("now") - pd.Timestamp(last_modification * 1e9)
@@ -46,7 +48,10 @@ class ADDS_FAA_OpenData:
         else:
             self.download_data()
 
-        with self.cache_file.open("r") as fh:
+        return self.cache_file
+
+    def json_contents(self) -> Dict[str, Any]:
+        with self.check_cache().open("r") as fh:
             json_contents = json.load(fh)
 
         return json_contents  # type: ignore
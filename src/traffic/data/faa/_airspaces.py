@@ -5,6 +5,8 @@ from typing import Dict
 
 import geopandas as gpd
 
+import numpy as np
+import shapely
 from shapely.geometry import shape
 from shapely.ops import orient
 
@@ -19,50 +21,55 @@ class FAA_Airspace(ADDS_FAA_OpenData, Airspaces):
         super().__init__()
         self.data = data
         if data is None:
-            self.data = (
-                gpd.GeoDataFrame.from_features(self.json_contents())
-                .rename(
-                    columns=dict(
-                        NAME="name",
-                        LOWER_VAL="lower",
-                        UPPER_VAL="upper",
-                        TYPE_CODE="type",
-                        IDENT="designator",
-                    )
-                )
-                .assign(
-                    latitude=lambda df: df.geometry.centroid.y,
-                    longitude=lambda df: df.geometry.centroid.x,
-                    name=lambda df: df.name.str.strip(),
-                    lower=lambda df: df.lower.replace(-9998, 0),
-                    upper=lambda df: df.upper.replace(-9998, float("inf")),
+            # pyogrio parses the GeoJSON file straight into a GeoDataFrame;
+            # dates are kept as found in the file, and integers (int32 for
+            # OGR) as int64, as with the former json based reader
+            data = gpd.read_file(
+                self.check_cache(), engine="pyogrio", DATE_AS_STRING=True
+            )
+            data = data.astype(
+                dict.fromkeys(data.select_dtypes("int32").columns, np.int64)
+            ).rename(
+                columns=dict(
+                    NAME="name",
+                    LOWER_VAL="lower",
+                    UPPER_VAL="upper",
+                    TYPE_CODE="type",
+                    IDENT="designator",
                 )
-                .set_geometry("geometry")
             )
+            # shapely does not warn about centroids in a geographic CRS
+            centroid = shapely.centroid(data.geometry.array)
+            lower = data.lower.to_numpy()
+            upper = data.upper.to_numpy()
+            self.data = data.assign(
+                latitude=shapely.get_y(centroid),
+                longitude=shapely.get_x(centroid),
+                name=data.name.str.strip(),
+                lower=np.where(lower == -9998, 0, lower),
+                upper=np.where(upper == -9998, np.inf, upper),
+            ).set_geometry("geometry")
 
     def back(self) -> Dict[str, Airspace]:
-        features = [elt for elt in self.json_contents()["features"]]
         airspaces: Dict[str, Airspace] = dict()
 
-        for feat in features:
-            name = feat["properties"]["NAME"].strip()
+        for feat in self.json_contents()["features"]:
+            properties = feat["properties"]
+            name = properties["NAME"].strip()
+            lower, upper = properties["LOWER_VAL"], properties["UPPER_VAL"]
 
             airspace = Airspace(
                 name=name,
                 elements=[
                     ExtrudedPolygon(
                         orient(shape(feat["geometry"]), -1),
-                        feat["properties"]["LOWER_VAL"]
-                        if feat["properties"]["LOWER_VAL"] != -9998
-                        else 0,
-                        feat["properties"]["UPPER_VAL"]
-                        if feat["properties"]["UPPER_VAL"] != -9998
-                        else float("inf"),
+                        lower if lower != -9998 else 0,
+                        upper if upper != -9998 else float("inf"),
                     )
                 ],
-                type_=feat["properties"]["TYPE_CODE"],
-                designator=feat["properties"]["IDENT"],
-                properties=feat["properties"],
+                type_=properties["TYPE_CODE"],
+                designator=properties["IDENT"],
+                properties=properties,
             )
 
             if not airspace.shape.is_valid:
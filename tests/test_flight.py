@@ -71,6 +71,9 @@ def test_iterators() -> None:
     assert max_time["latitude"] == last_point.latitude
     assert max_time["altitude"] == last_point.altitude
 
+    min_xy_time = next(flight.xy_time)
+    assert min_xy_time[2] == flight.start.timestamp()
+
     max_xy_time = list(flight.xy_time)[-1]
     assert max_xy_time[0] == last_point.longitude
     assert max_xy_time[1] == last_point.latitude
@@ -157,6 +160,48 @@ def test_time_methods() -> None:
     assert point.timestamp == flight.stop
 
 
+def test_distance_tolerance() -> None:
+    flight = belevingsvlucht.first(minutes=10)
+    assert flight is not None
+    data = flight.data.assign(
+        timestamp=flight.data.timestamp + pd.Timedelta("200ms")
+    )
+    data.loc[data.index[5], "timestamp"] = pd.NaT
+    shifted = Flight(data)
+
+    # by default, only identical timestamps are matched
+    exact = flight.distance(flight)
+    assert exact is not None
+    assert len(exact) == len(flight) - 2  # between() excludes both ends
+    assert exact.lateral.max() == 0
+    table = flight.distance(shifted)
+    assert table is not None and table.shape[0] == 0
+
+    # otherwise, timestamps are matched within the tolerance
+    table = shifted.distance(flight, tolerance="1s")
+    assert table is not None
+    assert len(table) == len(exact) - 1  # the NaT timestamp is dropped
+    assert table.lateral.max() < 0.1
+    assert flight.distance(shifted, tolerance="100ms").shape[0] == 0  # type: ignore
+
+
+def test_time_methods_nat() -> None:
+    data = belevingsvlucht.data.copy()
+    assert isinstance(data.timestamp.dtype, pd.ArrowDtype)
+    data.loc[data.index[10], "timestamp"] = pd.NaT
+    flight = Flight(data)
+
+    first10 = flight.first(minutes=10)
+    assert first10 is not None
+    assert f"{first10.stop}" == "2018-05-30 15:31:37+00:00"
+    assert len(first10) == len(belevingsvlucht.first(minutes=10)) - 1
+
+    between = flight.between("2018-05-30 18:00", "2018-05-30 19:00")
+    expected = belevingsvlucht.between("2018-05-30 18:00", "2018-05-30 19:00")
+    assert between is not None and expected is not None
+    assert len(between) == len(expected)
+
+
 def test_bearing() -> None:
     ajaccio = cast(Flight, get_sample(calibration, "ajaccio"))
     ext_navaids = navaids.extent(ajaccio)
@@ -242,6 +287,21 @@ def test_clip_iterate() -> None:
     )
 
 
+def test_clip_buffered_shape() -> None:
+    schiphol = airports["EHAM"]
+    assert schiphol is not None
+    buffered_shape = schiphol.buffered_shape(2e-3)
+    assert buffered_shape.equals(schiphol.shape.buffer(2e-3))
+    assert schiphol.buffered_shape(2e-3) is buffered_shape
+    assert schiphol.buffered_shape(1e-3) is not buffered_shape
+
+    clipped = belevingsvlucht.clip_iterate(buffered_shape, strict=False)
+    reference = belevingsvlucht.clip_iterate(
+        schiphol.shape.buffer(2e-3), strict=False
+    )
+    assert [f.start for f in clipped] == [f.start for f in reference]
+
+
 def test_clip_point() -> None:
     records = [
         {
@@ -449,6 +509,22 @@ def test_resample_unwrapped() -> None:
     assert len(resampled_10) == 10
 
 
+def test_resample_bool() -> None:
+    df = pd.DataFrame.from_records(
+        [
+            (pd.Timestamp("2019-01-01 12:00:00Z"), 345, True),
+            (pd.Timestamp("2019-01-01 12:00:01Z"), 355, True),
+            (pd.Timestamp("2019-01-01 12:00:05Z"), 5, False),
+        ],
+        columns=["timestamp", "track", "onground"],
+    )
+
+    # as with resample().first(), booleans are interpolated as floats
+    resampled = Flight(df).resample("1s")
+    assert resampled.data.onground.dtype == np.float64
+    assert resampled.data.onground.tolist() == [1, 1, 0.75, 0.5, 0.25, 0]
+
+
 def test_resample_projection() -> None:
     flight = Flight(
         pd.DataFrame.from_dict(
@@ -468,6 +544,18 @@ def test_resample_projection() -> None:
 
     assert r1.cumdist_sum > r2.cumdist_sum
 
+    c1 = flight.resample_cumdist("1s")
+    c2 = flight.resample_cumdist("1s", projection="lcc")
+
+    assert len(c1) == len(r1)
+    assert c1.max("cumdist") == pytest.approx(r1.max("cumdist"), rel=1e-6)
+    assert c2.max("cumdist") == pytest.approx(r2.max("cumdist"), rel=1e-6)
+
+    shuffled = Flight(belevingsvlucht.data.sample(frac=1, random_state=42))
+    c3 = belevingsvlucht.resample_cumdist("1s")
+    c4 = shuffled.resample_cumdist("1s")
+    assert c4.max("cumdist") == pytest.approx(c3.max("cumdist"))
+
 
 def test_agg_time() -> None:
     flight = belevingsvlucht
@@ -638,6 +726,10 @@ def test_DME_NSE_computation() -> None:
 
     assert_frame_equal(result_df[["NSE", "NSE_idx"]], expected, rtol=1e-3)
 
+    single = dmes.query(f"name == '{next(iter(dmes)).name}'")
+    with pytest.raises(ValueError):
+        segment.compute_DME_NSE(single)  # type: ignore
+
 
 def test_split_condition() -> None:
     def no_split_below_5000(f1: Flight, f2: Flight) -> bool:
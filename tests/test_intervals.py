@@ -171,6 +171,15 @@ class TestCollectionSub:
         # no overlap between ic01 and ic07, nothing to substract
         assert c1 - c7 == c1.consolidate()
 
+    def test_span(self) -> None:
+        # one interval cutting through two disjoint intervals
+        assert c5 - IntervalCollection(h1, h4) == IntervalCollection(
+            Interval(h0, h1), Interval(h4, h6)
+        )
+        assert c5 - IntervalCollection(
+            start=[h4, h1], stop=[h5, h4]
+        ) == IntervalCollection(Interval(h0, h1), Interval(h5, h6))
+
 
 class TestCollectionUnion:
     def test_sup(self) -> None: